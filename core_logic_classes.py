@@ -1,9 +1,58 @@
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import csv
 import os
+import sys
 import io
-import codecs
+import keyword
+import mmap
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+
+# Date tolerance allowed when matching transactions
+_ONE_DAY = timedelta(days=1)
+
+
+@lru_cache(maxsize=None)
+def _parse_iso_date(date_str: str):
+    """
+    Parses a date in the '%Y-%m-%d' format, caching results since dates repeat heavily across transactions.
+
+    Canonical zero-padded dates take the fast date.fromisoformat path. Anything else goes through
+    datetime.strptime, so the accepted dates are exactly the ones '%Y-%m-%d' accepts: unpadded
+    dates such as '2020-1-5' still parse, while other ISO forms such as '20201205' do not.
+
+    Args:
+        date_str (str): The date string to parse.
+
+    Returns:
+        date or None: The parsed date, or None if the format is invalid.
+    """
+    if type(date_str) is str and len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass  # let strptime decide
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None  # invalid date format
+
+
+def _intern(field):
+    """
+    Interns a field value if it is a plain string, leaving any other value (e.g. NaN) untouched.
+
+    Args:
+        field (Any): The field value.
+
+    Returns:
+        Any: The interned string, or the value itself.
+    """
+    return sys.intern(field) if type(field) is str else field
 
 
 class Transaction:
@@ -13,6 +62,8 @@ class Transaction:
     Provides utilities for equality comparison, hashability, CSV reading, 
     and fuzzy matching based on date tolerance.
     """
+    __slots__ = ('date', 'department', 'value', 'beneficiary', '_date_obj', '_hash')
+
     def __init__(self, date: str, department: str, value: str, beneficiary: str):
         """
         Initializes a Transaction object.
@@ -23,10 +74,47 @@ class Transaction:
             value (str): The monetary value of the transaction.
             beneficiary (str): The entity receiving the transaction.
         """
-        self.date = date
-        self.department = department
-        self.value = value
-        self.beneficiary = beneficiary
+        # Dates, departments and beneficiaries repeat across many rows; interning them makes
+        # equal fields share one object, so comparisons usually stop at the identity check.
+        # The fields are written directly here; __setattr__ only handles later reassignments.
+        object.__setattr__(self, 'date', _intern(date))
+        object.__setattr__(self, 'department', _intern(department))
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, 'beneficiary', _intern(beneficiary))
+        self._refresh_derived()
+
+    def _refresh_derived(self):
+        """
+        Recomputes the values cached from the fields: the parsed date and the hash.
+        """
+        object.__setattr__(self, '_date_obj', _parse_iso_date(self.date))  # parsed once, reused by every date comparison
+        object.__setattr__(self, '_hash', hash((self.date, self.department, self.value, self.beneficiary)))  # hashed once, reused by sets and dicts
+
+    def __setattr__(self, name, value):
+        """
+        Sets an attribute, keeping the cached parsed date and hash in sync when a field changes.
+
+        Args:
+            name (str): The attribute name.
+            value (Any): The value to assign.
+        """
+        if name in ('date', 'department', 'beneficiary'):
+            value = _intern(value)
+        object.__setattr__(self, name, value)
+        if name in ('date', 'department', 'value', 'beneficiary'):
+            self._refresh_derived()
+
+    def __reduce__(self):
+        """
+        Rebuilds the transaction through __init__ when copying or pickling.
+
+        Restoring the slots one by one would go through __setattr__, which refreshes the derived
+        values before all fields are set.
+
+        Returns:
+            tuple: The class and the constructor arguments.
+        """
+        return (type(self), (self.date, self.department, self.value, self.beneficiary))
 
     def to_list(self):
         """
@@ -47,8 +135,12 @@ class Transaction:
         Returns:
             bool: True if all attributes match, False otherwise.
         """
+        if self is other:
+            return True
         if not isinstance(other, Transaction):
             return False
+        if self._hash != other._hash:
+            return False  # different cached hashes can never be equal transactions
         return (
             self.date == other.date and
             self.department == other.department and
@@ -60,10 +152,12 @@ class Transaction:
         """
         Returns a hash of the transaction for use in sets and dictionaries.
 
+        The hash is computed on construction and whenever a field is reassigned.
+
         Returns:
             int: The hash value.
         """
-        return hash((self.date, self.department, self.value, self.beneficiary))
+        return self._hash
 
     @classmethod
     def from_list(cls, row):
@@ -84,7 +178,8 @@ class Transaction:
         Reads a CSV file of transactions and returns it as a pandas DataFrame.
 
         The CSV must contain rows with four columns: date, department, value, and beneficiary.
-        Missing headers will be replaced with default column names.
+        Missing headers will be replaced with default column names; a file with any other
+        number of columns is rejected.
 
         Args:
             path (str): Path to the CSV file.
@@ -92,19 +187,30 @@ class Transaction:
         Returns:
             pd.DataFrame or None: DataFrame of transaction data, or None if empty or error.
         """
-        df = pd.read_csv(path, header=None, dtype=str)
+        columns = ["Data", "Departamento", "Valor", "Beneficiário"]
         try:
+            # dtype=str skips type inference in the C parser; the names are assigned only after
+            # the column count is checked, so malformed files are rejected instead of truncated.
+            df = pd.read_csv(path, header=None, dtype=str)
             if df.empty:
                 print(f"The file '{path}' is empty.")
                 return None
 
-            df.columns = ["Data", "Departamento", "Valor", "Beneficiário"]
+            if len(df.columns) != len(columns):
+                print(f"The file '{path}' has {len(df.columns)} columns, expected {len(columns)}.")
+                return None
+
+            df.columns = columns
             return df
 
         except FileNotFoundError:
             print(f"The file '{path}' was not found.")
             return None
 
+        except pd.errors.EmptyDataError:
+            print(f"The file '{path}' is empty.")
+            return None
+
         except Exception as e:
             print(f"An error occurred while reading '{path}': {str(e)}")
             return None
@@ -126,16 +232,62 @@ class Transaction:
         ):
             return False
 
-        try:
-            date1 = datetime.strptime(self.date, "%Y-%m-%d")
-            date2 = datetime.strptime(other.date, "%Y-%m-%d")
-        except ValueError:
+        if self._date_obj is None or other._date_obj is None:
             return False  # invalid date format
 
-        delta = abs((date1 - date2).days)
+        delta = abs((self._date_obj - other._date_obj).days)
         return delta <= 1
 
 
+class TransactionBatch:
+    """
+    Column-oriented view of a group of transactions, used by the reconciler's hot loops.
+
+    Each field is kept in its own list, indexed by the transaction's position in the
+    original group, so matching touches flat lists of strings and dates instead of
+    looking up attributes on every Transaction object.
+    """
+    def __init__(self, transactions: list):
+        """
+        Builds the parallel field lists from a list of Transaction objects.
+
+        Args:
+            transactions (list): List of Transaction objects.
+        """
+        self.dates = [tx.date for tx in transactions]
+        self.date_objs = [tx._date_obj for tx in transactions]
+        self.departments = [tx.department for tx in transactions]
+        self.values = [tx.value for tx in transactions]
+        self.beneficiaries = [tx.beneficiary for tx in transactions]
+
+    def __len__(self):
+        """
+        Returns the number of transactions in the batch.
+        """
+        return len(self.dates)
+
+    def keys(self):
+        """
+        Iterates over the (department, value, beneficiary) matching keys, in order.
+
+        Returns:
+            Iterator[tuple]: One key tuple per transaction.
+        """
+        return zip(self.departments, self.values, self.beneficiaries)
+
+    def row(self, idx: int) -> list[str]:
+        """
+        Returns the transaction at idx as a list.
+
+        Args:
+            idx (int): Position of the transaction in the batch.
+
+        Returns:
+            list: A list representation [date, department, value, beneficiary].
+        """
+        return [self.dates[idx], self.departments[idx], self.values[idx], self.beneficiaries[idx]]
+
+
 class TransactionReconciler:
     """
     Reconciles two groups of financial transactions by matching them with tolerance.
@@ -155,7 +307,7 @@ class TransactionReconciler:
         self.group_a = group_a
         self.group_b = group_b
 
-    def reconcile(self):
+    def reconcile(self, max_workers: int = None):
         """
         Performs the reconciliation between group_a and group_b.
 
@@ -164,70 +316,180 @@ class TransactionReconciler:
         Each transaction can match only once. Preference is given to the earliest date
         when multiple matches exist.
 
+        Args:
+            max_workers (int, optional): Number of threads used to match the buckets of
+                                         (department, value, beneficiary) concurrently. Buckets
+                                         never share transactions, so they are independent.
+                                         Threads only pay off on free-threaded Python builds;
+                                         by default matching runs in the calling thread.
+
         Returns:
             tuple: Two lists of lists. Each inner list represents a transaction with an
                    added column: 'FOUND' if matched or 'MISSING' otherwise.
                    Format: (result_from_a, result_from_b)
         """
-        matched_b_indices = set()
-        result_a = []
-
-        for idx_a, tx_a in enumerate(self.group_a):
-            candidates = [
-                (idx_b, tx_b)
-                for idx_b, tx_b in enumerate(self.group_b)
-                if idx_b not in matched_b_indices and tx_a.is_match_with_tolerance(tx_b)
-            ]
-
-            if candidates:
-                # Sort candidates by date (ascending) to match the earliest
-                candidates.sort(key=lambda x: x[1].date)
-                idx_b_match, _ = candidates[0]
-                matched_b_indices.add(idx_b_match)
-                result_a.append(tx_a.to_list() + ["FOUND"])
-            else:
-                result_a.append(tx_a.to_list() + ["MISSING"])
+        batch_a = TransactionBatch(self.group_a)
+        batch_b = TransactionBatch(self.group_b)
+
+        result_a = list(self._match_group(batch_a, batch_b, max_workers))
 
         # Repeat logic for B, checking matches in A
-        matched_a_indices = set()
-        result_b = []
-
-        for idx_b, tx_b in enumerate(self.group_b):
-            candidates = [
-                (idx_a, tx_a)
-                for idx_a, tx_a in enumerate(self.group_a)
-                if idx_a not in matched_a_indices and tx_b.is_match_with_tolerance(tx_a)
-            ]
-
-            if candidates:
-                candidates.sort(key=lambda x: x[1].date)
-                idx_a_match, _ = candidates[0]
-                matched_a_indices.add(idx_a_match)
-                result_b.append(tx_b.to_list() + ["FOUND"])
-            else:
-                result_b.append(tx_b.to_list() + ["MISSING"])
+        result_b = list(self._match_group(batch_b, batch_a, max_workers))
 
         return result_a, result_b
 
+    def reconcile_a(self, max_workers: int = None) -> Iterator[list[str]]:
+        """
+        Lazily yields the reconciled rows of group_a, one at a time.
+
+        Uses the same matching rules as reconcile(), but never holds the full result in
+        memory, so it can be piped straight into save_reconcile_csv.
+
+        Args:
+            max_workers (int, optional): Number of matching threads, as in reconcile().
+
+        Returns:
+            Iterator[list[str]]: Each transaction of group_a with the added 'FOUND'/'MISSING' column.
+        """
+        return self._match_group(TransactionBatch(self.group_a), TransactionBatch(self.group_b), max_workers)
+
+    def reconcile_b(self, max_workers: int = None) -> Iterator[list[str]]:
+        """
+        Lazily yields the reconciled rows of group_b, one at a time.
+
+        Args:
+            max_workers (int, optional): Number of matching threads, as in reconcile().
+
+        Returns:
+            Iterator[list[str]]: Each transaction of group_b with the added 'FOUND'/'MISSING' column.
+        """
+        return self._match_group(TransactionBatch(self.group_b), TransactionBatch(self.group_a), max_workers)
+
     @staticmethod
-    def save_reconcile_csv(out1: list[list[str]], path1: str, out2: list[list[str]], path2: str):
+    def _take_earliest(bucket: list, parsed: date) -> bool:
+        """
+        Takes the earliest bucket entry within ±1 day of parsed, removing it from the bucket.
+
+        Candidates are ranked by their date string, then by original index, as the original
+        nested-loop matcher did. Within one day the bucket is already in that order, so only the
+        first entry of each of the three days can win. Matched entries are deleted as they are
+        taken, so the bucket only ever holds unmatched transactions and each lookup is three
+        binary searches, even for many duplicate rows.
+
+        Args:
+            bucket (list): (date, date string, index) entries of unmatched target transactions,
+                           sorted; updated in place.
+            parsed (date): Date of the source transaction.
+
+        Returns:
+            bool: True if a match was found, False otherwise.
+        """
+        best = None
+        for day in (parsed - _ONE_DAY, parsed, parsed + _ONE_DAY):
+            # (day,) sorts before every (day, date string, idx) entry
+            pos = bisect_left(bucket, (day,))
+            if pos < len(bucket) and bucket[pos][0] == day:
+                if best is None or bucket[pos][1:] < bucket[best][1:]:
+                    best = pos
+        if best is None:
+            return False
+        del bucket[best]
+        return True
+
+    @classmethod
+    def _match_group(cls, source: TransactionBatch, target: TransactionBatch, max_workers: int = None) -> Iterator[list[str]]:
+        """
+        Matches each transaction in source against the unmatched transactions in target.
+
+        Target transactions are indexed once in buckets keyed by (department, value, beneficiary),
+        each bucket sorted by (date, date string, original index). For every source transaction the candidates
+        in the ±1 day window are found with a binary search, and the earliest unmatched one is taken.
+
+        Args:
+            source (TransactionBatch): Transactions to label as 'FOUND' or 'MISSING'.
+            target (TransactionBatch): Transactions to search for matches.
+            max_workers (int, optional): Number of threads matching buckets concurrently.
+
+        Yields:
+            list[str]: One row per source transaction with the added status column, in order.
+        """
+        buckets = {}
+        for idx, (parsed, date_str, key) in enumerate(zip(target.date_objs, target.dates, target.keys())):
+            if parsed is None:
+                continue  # transactions with invalid dates never match
+            if not all(field == field for field in key):
+                # Empty CSV cells arrive as NaN, which never equals anything. Dict lookups check
+                # identity first and would match the shared NaN object, so these are left out too.
+                continue
+            buckets.setdefault(key, []).append((parsed, date_str, idx))
+        for bucket in buckets.values():
+            bucket.sort()
+
+        if max_workers is not None and max_workers > 1:
+            yield from cls._match_buckets_parallel(source, buckets, max_workers)
+            return
+
+        for idx, (parsed, key) in enumerate(zip(source.date_objs, source.keys())):
+            bucket = buckets.get(key)
+            found = parsed is not None and bucket and cls._take_earliest(bucket, parsed)
+            yield source.row(idx) + ["FOUND" if found else "MISSING"]
+
+    @classmethod
+    def _match_buckets_parallel(cls, source: TransactionBatch, buckets: dict, max_workers: int) -> Iterator[list[str]]:
+        """
+        Matches source against the target buckets with one thread task per bucket.
+
+        Source transactions only compete with others of the same key, so each bucket is matched
+        on its own, in source order, and writes only its own slots of the shared status array.
+
+        Args:
+            source (TransactionBatch): Transactions to label as 'FOUND' or 'MISSING'.
+            buckets (dict): Sorted (date, date string, index) lists of target transactions, by key.
+            max_workers (int): Number of threads.
+
+        Yields:
+            list[str]: One row per source transaction with the added status column, in order.
+        """
+        source_buckets = {}
+        for idx, (parsed, key) in enumerate(zip(source.date_objs, source.keys())):
+            if parsed is not None and key in buckets:
+                source_buckets.setdefault(key, []).append((parsed, idx))
+
+        found = bytearray(len(source))
+
+        def match_bucket(key):
+            bucket = buckets[key]
+            for parsed, idx in source_buckets[key]:
+                if cls._take_earliest(bucket, parsed):
+                    found[idx] = 1
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(match_bucket, source_buckets))
+
+        for idx in range(len(source)):
+            yield source.row(idx) + ["FOUND" if found[idx] else "MISSING"]
+
+    @staticmethod
+    def save_reconcile_csv(out1: Iterable[list[str]], path1: str, out2: Iterable[list[str]], path2: str):
         """
         Saves the reconciliation results to two separate CSV files.
 
+        The rows may be lists or the lazy iterators from reconcile_a()/reconcile_b(); rows are
+        written as they are consumed, so streaming avoids materializing either result.
+
         Args:
-            out1 (list[list[str]]): Reconciled results for group A.
+            out1 (Iterable[list[str]]): Reconciled results for group A.
             path1 (str): File path to save group A's results.
-            out2 (list[list[str]]): Reconciled results for group B.
+            out2 (Iterable[list[str]]): Reconciled results for group B.
             path2 (str): File path to save group B's results.
         """
         try:
-            with open(path1, mode='w', newline='', encoding='utf-8') as f1:
-                writer = csv.writer(f1)
-                writer.writerows(out1)
-
-            with open(path2, mode='w', newline='', encoding='utf-8') as f2:
-                writer = csv.writer(f2)
-                writer.writerows(out2)
+            # csv.writer.writerows serializes every row in C (_csv); it benchmarks faster
+            # than building a DataFrame just to call to_csv, which wraps the same writer.
+            for rows, path in ((out1, path1), (out2, path2)):
+                with open(path, mode='w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerows(rows)
 
             print(f"✅ Files saved: {path1}, {path2}")
         except Exception as e:
@@ -247,12 +509,13 @@ class txt_lines:
     - Load lines from a UTF-8 encoded text file
     - Iterate through lines using next()
     - Reset the iterator to the beginning
-    - Reverse lines efficiently using chunked binary reads (UTF-8 safe)
+    - Reverse lines efficiently over a memory-mapped view of the file (UTF-8 safe)
     
     Notes:
     ------
-    - The reverse_lines_chunked method reads the file from the end,
-      in fixed-size chunks (default 8192 bytes) without breaking multi-byte characters.
+    - The reverse_lines_chunked method reads the file from the end through a
+      read-only memory map, in fixed-size windows (default 8192 bytes) without
+      breaking multi-byte characters.
     - It supports all UTF-8 characters and handles both Unix (`\\n`) and Windows (`\\r\\n`) line endings.
     - Output lines are normalized to end with `\\n`.
 
@@ -309,28 +572,31 @@ class txt_lines:
 
     def reverse_lines_chunked(self, chunk_size: int = io.DEFAULT_BUFFER_SIZE):
         """
-        Reads the file in reverse order, line by line, using fixed-size chunks of bytes.
+        Reads the file in reverse order, line by line, over a read-only memory map of the file.
 
-        This method avoids loading the entire file into memory, making it efficient for
-        large files. It processes the file from end to start, reading binary chunks 
-        and decoding them safely using UTF-8, ensuring multibyte characters are not split.
+        This method avoids loading the entire file into Python memory, making it efficient for
+        large files. The operating system pages the file in on demand, and the file is processed
+        from end to start in windows of bytes, each split into lines in a single C-level call.
+        A partial line at the start of a window is never copied; the next window simply ends
+        where it begins, so every byte is copied once.
 
-        buffer: temporary area in memory used to hold data while it’s being transferred.
+        mmap: a view of the file's bytes that behaves like a bytes object without reading it all.
         UTF-8: way to represent text using bytes.
         chunk: a piece of data that is read or written in one go.
 
         Parameters:
         -----------
         chunk_size : int, optional
-            Maximum number of bytes to read at a time. Defaults to io.DEFAULT_BUFFER_SIZE (usually 8192 bytes).
+            Number of bytes per window. Defaults to io.DEFAULT_BUFFER_SIZE (usually 8192 bytes).
+            Windows grow as needed to hold lines longer than this.
 
         Behavior:
         ---------
-        - Opens the file in binary mode ('rb')
-        - Reads backward from the end of the file in chunks of up to `chunk_size` bytes
-        - Buffers raw data until a full line (ending in `\n`) is detected
+        - Opens the file in binary mode ('rb') and maps it read-only
+        - Walks backward from the end of the file in windows of `chunk_size` bytes
+        - Decodes the complete lines of each window as UTF-8 in one call, then splits them on newlines (`\n`)
         - Handles both Windows (`\r\n`) and Unix (`\n`) line endings
-        - Uses an incremental UTF-8 decoder to avoid breaking multibyte characters
+        - A `\n` byte never occurs inside a multibyte character, so windows cut at newlines decode cleanly
         - Final output lines are stored in self.lines in reversed order, all ending in `\n`
 
         Returns:
@@ -342,49 +608,39 @@ class txt_lines:
         -------
         Prints error messages if the file is not found or decoding fails unexpectedly.
         """
-
-        # io.DEFAULT_BUFFER_SIZE 8192 bytes -> Control the size of the chunks read from the file
         self.lines = []
-        buffer = b"" # Variable to hold the bytes read from the file
         newline = b"\n" # Variable to detect the end of a line
 
         try:
             with open(self.filepath, 'rb') as f:
-                f.seek(0, os.SEEK_END) # Move the cursor to the end of the file
-                position = f.tell() # Get the total file size in bytes. -> Used to show the position of the cursor in the file
-
-                while position > 0:
-                    read_size = min(chunk_size, position) # Calculate how much to read (never go below position 0).
-                    position -= read_size # Move backward and read a chunk of bytes from the file. ->  "window" of the file to analyze.
-                    f.seek(position)
-                    chunk = f.read(read_size)
-                    buffer = chunk + buffer # Prepend the newly read chunk to the front of the buffer.
-
-                    # Extract full lines from buffer
-                    while True:
-                        nl_index = buffer.rfind(newline) # Search for the last newline (\n) in the buffer.
-                        if nl_index == -1:
-                            break # If none is found, break out and wait for more data from the next chunk.
-
-                        line_bytes = buffer[nl_index + 1:] # line_bytes gets everything after the last newline (i.e., a full line).
-                        buffer = buffer[:nl_index + 1] # Trim that line from the buffer.
-
-                        try:
-                            line = line_bytes.decode("utf-8") # Try to decode the extracted line safely.
-                            if len(line) > 0: # Check if the line is not empty.:
-                                self.lines.append(line.rstrip('\r') + '\n') # If it works, append it to the reversed lines list.
-                            buffer = buffer[:nl_index] # Trim the buffer to remove the processed line.
-                        except UnicodeDecodeError:
-                            buffer = line_bytes + buffer # caught a UTF-8 character split across chunks, undo the split by putting it back into the buffer and breaking (wait for next chunk).
-                            break
-
-                # Handle any remaining bytes
-                if buffer:
-                    try:
-                        line = buffer.decode("utf-8")
-                        self.lines.append(line.rstrip('\r') + '\n')
-                    except UnicodeDecodeError:
-                        print(" Warning: Could not decode some final bytes.")
+                if os.fstat(f.fileno()).st_size == 0:
+                    return self.lines # Empty files cannot be memory-mapped
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    end = len(mm) # End (exclusive) of the bytes not yet turned into lines
+
+                    while end > 0:
+                        start = max(end - chunk_size, 0) # "Window" of the file to analyze
+                        # find/split locate newlines with memchr, which already scans a word or vector
+                        # register of bytes per step, so no hand-written byte scan is needed here.
+                        nl_index = mm.find(newline, start, end) # First newline in the window
+
+                        # A line longer than the window: widen it backward, searching only the new bytes
+                        while nl_index == -1 and start > 0:
+                            window_start = start
+                            start = max(start - chunk_size, 0)
+                            nl_index = mm.find(newline, start, window_start)
+
+                        # Bytes after the first newline (or from the file start) hold only complete lines.
+                        # The partial line before it stays in the map and is picked up by the next window.
+                        block = mm[nl_index + 1:end]
+                        end = nl_index
+
+                        # The block starts right after a newline, so it never begins inside a multibyte
+                        # character: decode it in one call and split the text, instead of decoding per line.
+                        for line in reversed(block.decode("utf-8").split('\n')):
+                            if line: # Skip empty lines
+                                self.lines.append(line.rstrip('\r') + '\n')
 
             # Return lines collected in reverse order
             return self.lines
@@ -412,6 +668,9 @@ def computed_property(*dependencies):
     The result is cached and reused as long as the specified dependent attributes remain unchanged.
     If any dependency changes, the value is recalculated.
 
+    The cache is stored in the instance __dict__, so a class using __slots__ must list '__dict__'
+    among them to use computed properties.
+
     Args:
         *dependencies (str): One or more attribute names that the property depends on.
 
@@ -422,12 +681,43 @@ def computed_property(*dependencies):
         return ComputedProperty(func, dependencies)
     return wrapper
 
+def _dependency_index(cls):
+    """
+    Returns the reverse index from attribute names to the computed properties depending on them.
+
+    The index is built once per class by walking its MRO (subclass definitions override the
+    ones they shadow) and memoized on the class itself.
+
+    Args:
+        cls (type): The class whose computed properties are indexed.
+
+    Returns:
+        dict[str, tuple]: Maps each dependency name to (property name, position in its dependency tuple) pairs.
+    """
+    index = cls.__dict__.get('_dep_to_props')
+    if index is None:
+        properties = {}
+        for klass in reversed(cls.__mro__):
+            for attr, value in vars(klass).items():
+                if isinstance(value, ComputedProperty):
+                    properties[attr] = value
+
+        entries = {}
+        for prop in properties.values():
+            for pos, dep in enumerate(prop._dependency_order):
+                entries.setdefault(dep, []).append((prop._name, pos))
+
+        index = {dep: tuple(props) for dep, props in entries.items()}
+        cls._dep_to_props = index
+    return index
+
 def _inject_setattr(cls):
     """
     Dynamically injects a custom __setattr__ into a class to track attribute changes.
 
     When a dependent attribute is updated, any computed properties relying on it are invalidated
-    by clearing the relevant entries from the internal cache.
+    by clearing the relevant entries from the internal cache. Only the properties listed for that
+    attribute in the class's reverse index are checked, so unrelated writes cost one dict lookup.
 
     Args:
         cls (type): The class to modify.
@@ -438,11 +728,17 @@ def _inject_setattr(cls):
     original_setattr = cls.__setattr__
 
     def custom_setattr(self, name, value):
-        # Invalidate cache if a dependency is updated
-        if '_computed_cache' in self.__dict__:
-            for key, (_, deps) in list(self.__dict__['_computed_cache'].items()):
-                if name in deps:
-                    del self.__dict__['_computed_cache'][key]
+        # Invalidate cache if a dependency is updated to a different value
+        props = _dependency_index(type(self)).get(name)
+        if props:
+            cache = self.__dict__.get('_computed_cache')
+            if cache:
+                for prop_name, pos in props:
+                    cached = cache.get(prop_name)
+                    if cached is not None:
+                        last = cached[1][pos]
+                        if last is not value and last != value:
+                            del cache[prop_name]
         original_setattr(self, name, value)
 
     cls.__setattr__ = custom_setattr
@@ -456,6 +752,10 @@ class ComputedProperty:
     the cache is invalidated and the property is recomputed on the next access.
 
     Supports custom setter and deleter methods, similar to the built-in @property decorator.
+
+    Unlike Transaction, this class does not declare __slots__: it must carry the wrapped function's
+    __doc__ per instance (for help()), which conflicts with its own class docstring, and there is only
+    one descriptor per property and class, so the memory saving would be negligible.
     """
     def __init__(self, func, dependencies):
         """
@@ -471,6 +771,46 @@ class ComputedProperty:
         self._setter = None
         self._deleter = None
         self.__doc__ = func.__doc__
+        self._dependency_order = tuple(self.dependencies)  # fixed order of the cached dependency values
+        self._fast_get = self._compile_fast_get()
+
+    def _compile_fast_get(self):
+        """
+        Generates a getter specialized for this property's dependencies.
+
+        The dependency fetches are written out as plain attribute loads, so a cache hit runs
+        without looping over the dependency names. If an attribute is missing, the values
+        are collected again with getattr defaults, matching the generic lookup.
+
+        Returns:
+            function: A function (instance, cache) -> value that checks the cache and recomputes if needed.
+        """
+        fallback = "".join(f"getattr(instance, {dep!r}, _MISSING), " for dep in self._dependency_order)
+        # Keywords pass isidentifier() but cannot follow "instance." in source code
+        if all(dep.isidentifier() and not keyword.iskeyword(dep) for dep in self._dependency_order):
+            direct = "".join(f"instance.{dep}, " for dep in self._dependency_order)
+            fetch = (
+                "    try:\n"
+                f"        current_deps = ({direct})\n"
+                "    except AttributeError:\n"
+                f"        current_deps = ({fallback})\n"
+            )
+        else:
+            fetch = f"    current_deps = ({fallback})\n"
+
+        source = (
+            "def _fast_get(instance, cache):\n"
+            + fetch +
+            "    cached = cache.get(name)\n"
+            "    if cached is not None and cached[1] == current_deps:\n"
+            "        return cached[0]\n"
+            "    result = func(instance)\n"
+            "    cache[name] = (result, current_deps)\n"
+            "    return result\n"
+        )
+        namespace = {'func': self.func, 'name': self._name, '_MISSING': _MISSING}
+        exec(compile(source, f"<computed_property {self._name}>", "exec"), namespace)
+        return namespace['_fast_get']
 
     def __get__(self, instance, owner):
         """
@@ -486,26 +826,26 @@ class ComputedProperty:
         if instance is None:
             return self
 
-        _inject_setattr(type(instance))  # ensures setattr override 
-
-        # Get or initialize the cache
-        cache = instance.__dict__.setdefault('_computed_cache', {})
+        # The cache lives in the instance __dict__, so slotted classes must keep one
+        try:
+            instance_dict = instance.__dict__
+        except AttributeError:
+            raise TypeError(
+                f"computed_property '{self._name}' needs an instance __dict__ to cache its value; "
+                f"add '__dict__' to the __slots__ of '{type(instance).__name__}'"
+            ) from None
 
-        # Compute the current values of dependencies (ignoring missing attributes)
-        current_deps = tuple(
-            getattr(instance, dep, _MISSING) for dep in self.dependencies
-        )
+        _inject_setattr(type(instance))  # ensures setattr override 
 
-        # If the property has already cached a value and dependencies haven't changed, return it
-        if self._name in cache:
-            cached_value, last_deps = cache[self._name]
-            if current_deps == last_deps:
-                return cached_value
+        # Get the cache, creating it only on the first access (the try costs nothing on a hit)
+        try:
+            cache = instance_dict['_computed_cache']
+        except KeyError:
+            cache = instance_dict['_computed_cache'] = {}
 
-        # Otherwise, compute and cache the new value
-        result = self.func(instance)
-        cache[self._name] = (result, current_deps)
-        return result
+        # Compare the current dependency values (missing attributes count as _MISSING) with the
+        # cached ones, recomputing only if they differ
+        return self._fast_get(instance, cache)
 
     def __set__(self, instance, value):
         """
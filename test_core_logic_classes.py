@@ -0,0 +1,354 @@
+import copy
+import os
+import pickle
+import random
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+
+from core_logic_classes import (
+    Transaction,
+    TransactionReconciler,
+    computed_property,
+    txt_lines,
+)
+
+
+def reference_reconcile(group_a, group_b):
+    """
+    The original nested-loop reconciliation, kept as the oracle for the bucketed matcher.
+    """
+    def is_match(tx, other):
+        # Field by field, as the original did: tuple comparison would treat a shared NaN as equal
+        if (
+            tx.department != other.department or
+            tx.value != other.value or
+            tx.beneficiary != other.beneficiary
+        ):
+            return False
+        try:
+            date1 = datetime.strptime(tx.date, "%Y-%m-%d")
+            date2 = datetime.strptime(other.date, "%Y-%m-%d")
+        except ValueError:
+            return False
+        return abs((date1 - date2).days) <= 1
+
+    def match(source, target):
+        matched, result = set(), []
+        for tx in source:
+            candidates = [
+                (idx, other) for idx, other in enumerate(target)
+                if idx not in matched and is_match(tx, other)
+            ]
+            if candidates:
+                candidates.sort(key=lambda x: x[1].date)
+                matched.add(candidates[0][0])
+                result.append(tx.to_list() + ["FOUND"])
+            else:
+                result.append(tx.to_list() + ["MISSING"])
+        return result
+
+    return match(group_a, group_b), match(group_b, group_a)
+
+
+def reference_reverse_lines(path, chunk_size):
+    """
+    The original buffer-prepending reverse reader, kept as the oracle for the mmap version.
+    """
+    lines, buffer = [], b""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            buffer = f.read(read_size) + buffer
+            while True:
+                nl_index = buffer.rfind(b"\n")
+                if nl_index == -1:
+                    break
+                line_bytes = buffer[nl_index + 1:]
+                buffer = buffer[:nl_index]
+                if line_bytes:
+                    lines.append(line_bytes.decode("utf-8").rstrip('\r') + '\n')
+        if buffer:
+            lines.append(buffer.decode("utf-8").rstrip('\r') + '\n')
+    return lines
+
+
+def random_rows(rng, n):
+    rows = []
+    for _ in range(n):
+        day = date(2020, 12, 1) + timedelta(days=rng.randint(0, 6))
+        date_str = rng.choice([
+            day.isoformat(),
+            day.isoformat(),
+            f"{day.year}-{day.month}-{day.day}",  # unpadded, valid for '%Y-%m-%d'
+            day.isoformat().replace("-", ""),      # compact ISO, invalid for '%Y-%m-%d'
+            "bad-date",
+            "",
+        ])
+        rows.append([date_str, rng.choice(["Tec", "Jur"]), rng.choice(["1.00", "2.00"]), rng.choice(["X", "Y"])])
+    return rows
+
+
+class TestTransactionReconciler(unittest.TestCase):
+
+    def assert_matches_reference(self, rows_a, rows_b, **kwargs):
+        group_a = [Transaction.from_list(row) for row in rows_a]
+        group_b = [Transaction.from_list(row) for row in rows_b]
+        expected = reference_reconcile(group_a, group_b)
+        self.assertEqual(TransactionReconciler(group_a, group_b).reconcile(**kwargs), expected)
+
+    def test_example_from_challenge(self):
+        rows_a = [
+            ['2020-12-04', 'Tecnologia', '16.00', 'Bitbucket'],
+            ['2020-12-04', 'Jurídico', '60.00', 'LinkSquares'],
+            ['2020-12-05', 'Tecnologia', '50.00', 'AWS'],
+        ]
+        rows_b = [
+            ['2020-12-04', 'Tecnologia', '16.00', 'Bitbucket'],
+            ['2020-12-05', 'Tecnologia', '49.99', 'AWS'],
+            ['2020-12-04', 'Jurídico', '60.00', 'LinkSquares'],
+        ]
+        out_a, out_b = TransactionReconciler(
+            [Transaction.from_list(row) for row in rows_a],
+            [Transaction.from_list(row) for row in rows_b],
+        ).reconcile()
+        self.assertEqual([row[-1] for row in out_a], ["FOUND", "FOUND", "MISSING"])
+        self.assertEqual([row[-1] for row in out_b], ["FOUND", "MISSING", "FOUND"])
+
+    def test_random_groups_match_nested_loop(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            self.assert_matches_reference(random_rows(rng, rng.randint(0, 30)), random_rows(rng, rng.randint(0, 30)))
+
+    def test_random_groups_match_nested_loop_with_threads(self):
+        rng = random.Random(1)
+        for _ in range(100):
+            self.assert_matches_reference(
+                random_rows(rng, rng.randint(0, 30)), random_rows(rng, rng.randint(0, 30)), max_workers=4
+            )
+
+    def test_duplicate_rows(self):
+        rows = [['2020-12-04', 'Tec', '1.00', 'X']] * 5 + [['2020-12-05', 'Tec', '1.00', 'X']] * 3
+        self.assert_matches_reference(rows, rows[:6])
+        self.assert_matches_reference(rows[:2], rows)
+
+    def test_invalid_and_empty_dates_never_match(self):
+        rows = [['', 'Tec', '1.00', 'X'], ['bad-date', 'Tec', '1.00', 'X'], ['20201204', 'Tec', '1.00', 'X']]
+        out_a, out_b = TransactionReconciler(
+            [Transaction.from_list(row) for row in rows],
+            [Transaction.from_list(row) for row in rows],
+        ).reconcile()
+        self.assertEqual({row[-1] for row in out_a + out_b}, {"MISSING"})
+
+    def test_empty_csv_cells_never_match(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'transactions.csv')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('2020-12-04,Tec,1.00,\n2020-12-04,,2.00,X\n2020-12-05,Tec,3.00,X\n')
+            rows = Transaction.read_transaction_csv(path).values.tolist()
+
+        group = [Transaction.from_list(row) for row in rows]
+        out_a, out_b = TransactionReconciler(group, list(group)).reconcile()
+        self.assertEqual([row[-1] for row in out_a], ["MISSING", "MISSING", "FOUND"])
+        self.assertEqual([row[-1] for row in out_b], ["MISSING", "MISSING", "FOUND"])
+        self.assertEqual((out_a, out_b), reference_reconcile(group, list(group)))
+        self.assertEqual(TransactionReconciler(group, list(group)).reconcile(max_workers=4), (out_a, out_b))
+
+    def test_streaming_matches_reconcile(self):
+        rng = random.Random(2)
+        group_a = [Transaction.from_list(row) for row in random_rows(rng, 40)]
+        group_b = [Transaction.from_list(row) for row in random_rows(rng, 40)]
+        reconciler = TransactionReconciler(group_a, group_b)
+        self.assertEqual((list(reconciler.reconcile_a()), list(reconciler.reconcile_b())), reconciler.reconcile())
+
+
+class TestTransaction(unittest.TestCase):
+
+    def test_field_writes_refresh_equality_and_hash(self):
+        a = Transaction('2020-12-04', 'Tec', '1.00', 'X')
+        b = Transaction('2020-12-04', 'Tec', '2.00', 'X')
+        self.assertNotEqual(a, b)
+        b.value = '1.00'
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+
+    def test_date_write_refreshes_tolerance_match(self):
+        a = Transaction('2020-12-04', 'Tec', '1.00', 'X')
+        b = Transaction('2020-12-05', 'Tec', '1.00', 'X')
+        self.assertTrue(a.is_match_with_tolerance(b))
+        b.date = '2020-12-10'
+        self.assertFalse(a.is_match_with_tolerance(b))
+
+    def test_copy_and_pickle_round_trip(self):
+        tx = Transaction('2020-12-04', 'Tec', '1.00', 'X')
+        for clone in (copy.copy(tx), copy.deepcopy(tx), pickle.loads(pickle.dumps(tx))):
+            self.assertIsNot(clone, tx)
+            self.assertEqual(clone, tx)
+            self.assertEqual(hash(clone), hash(tx))
+            self.assertTrue(clone.is_match_with_tolerance(Transaction('2020-12-05', 'Tec', '1.00', 'X')))
+
+    def test_read_transaction_csv_rejects_wrong_column_count(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'bad.csv')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('2020-12-04,Tec,1.00,X,extra\n')
+            self.assertIsNone(Transaction.read_transaction_csv(path))
+
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('2020-12-04,Tec,1.00,X\n')
+            df = Transaction.read_transaction_csv(path)
+            self.assertEqual(list(df.columns), ["Data", "Departamento", "Valor", "Beneficiário"])
+            self.assertEqual(df.values.tolist(), [['2020-12-04', 'Tec', '1.00', 'X']])
+
+
+class TestReverseLinesChunked(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'lines.txt')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assert_matches_reference(self, text):
+        with open(self.path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        for chunk_size in (1, 2, 3, 5, 8192):
+            self.assertEqual(
+                txt_lines(self.path).reverse_lines_chunked(chunk_size),
+                reference_reverse_lines(self.path, chunk_size),
+                (text, chunk_size),
+            )
+
+    def test_example_file(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write("This is a file\nThis is line 2\nAnd this is line 3\n")
+        self.assertEqual(
+            txt_lines(self.path).reverse_lines_chunked(),
+            ["And this is line 3\n", "This is line 2\n", "This is a file\n"],
+        )
+
+    def test_crlf_and_missing_final_newline(self):
+        self.assert_matches_reference("first\r\nsecond\r\n\r\nthird")
+
+    def test_multibyte_characters_across_windows(self):
+        self.assert_matches_reference("é€𝄞\nçãõ€€\n𝄞𝄞𝄞\n")
+
+    def test_random_text_matches_reference(self):
+        rng = random.Random(3)
+        alphabet = ["a", "b", "é", "ç", "€", "𝄞", "\n", "\n", "\r\n", " "]
+        for _ in range(200):
+            self.assert_matches_reference("".join(rng.choice(alphabet) for _ in range(rng.randint(0, 80))))
+
+    def test_empty_file(self):
+        self.assert_matches_reference("")
+
+
+class TestComputedProperty(unittest.TestCase):
+
+    def make_vector(self):
+        calls = []
+
+        class Vector:
+            def __init__(self, x, y, z, color=None):
+                self.x, self.y, self.z = x, y, z
+                self.color = color
+
+            @computed_property('x', 'y', 'z')
+            def magnitude(self):
+                calls.append('magnitude')
+                return (self.x**2 + self.y**2 + self.z**2) ** 0.5
+
+        return Vector, calls
+
+    def test_value_is_cached_until_a_dependency_changes(self):
+        Vector, calls = self.make_vector()
+        v = Vector(3, 4, 0)
+        self.assertEqual(v.magnitude, 5.0)
+        self.assertEqual(v.magnitude, 5.0)
+        self.assertEqual(len(calls), 1)
+
+        v.color = 'red'  # not a dependency
+        self.assertEqual(v.magnitude, 5.0)
+        self.assertEqual(len(calls), 1)
+
+        v.y = 4  # same value
+        self.assertEqual(v.magnitude, 5.0)
+        self.assertEqual(len(calls), 1)
+
+        v.y = 0
+        self.assertEqual(v.magnitude, 3.0)
+        self.assertEqual(len(calls), 2)
+
+    def test_missing_dependency_setter_and_deleter(self):
+        calls = []
+
+        class Circle:
+            def __init__(self, radius=1):
+                self.radius = radius
+
+            @computed_property('radius', 'area')
+            def diameter(self):
+                """Computes the diameter."""
+                calls.append('diameter')
+                return self.radius * 2
+
+            @diameter.setter
+            def diameter(self, d):
+                self.radius = d / 2
+
+            @diameter.deleter
+            def diameter(self):
+                self.radius = 0
+
+        circle = Circle()
+        self.assertEqual((circle.diameter, circle.diameter), (2, 2))
+        self.assertEqual(len(calls), 1)
+
+        circle.area = 3  # a missing dependency appearing counts as a change
+        self.assertEqual(circle.diameter, 2)
+        self.assertEqual(len(calls), 2)
+
+        circle.diameter = 10
+        self.assertEqual((circle.radius, circle.diameter), (5, 10))
+        del circle.diameter
+        self.assertEqual(circle.diameter, 0)
+        self.assertEqual(Circle.diameter.__doc__, "Computes the diameter.")
+
+    def test_subclass_properties_are_invalidated(self):
+        class Base:
+            def __init__(self):
+                self.a = 1
+
+            @computed_property('a')
+            def double(self):
+                return self.a * 2
+
+        class Child(Base):
+            @computed_property('a')
+            def triple(self):
+                return self.a * 3
+
+        child = Child()
+        self.assertEqual((child.double, child.triple), (2, 3))
+        child.a = 2
+        self.assertEqual((child.double, child.triple), (4, 6))
+
+    def test_keyword_dependency_name(self):
+        class Tagged:
+            @computed_property('class')
+            def label(self):
+                return getattr(self, 'class', 'none')
+
+        tagged = Tagged()
+        self.assertEqual(tagged.label, 'none')
+        setattr(tagged, 'class', 'vip')
+        self.assertEqual(tagged.label, 'vip')
+
+
+if __name__ == '__main__':
+    unittest.main()